@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from time import monotonic, sleep
 import functools
-import itertools
+import logging
+import mmap
 import operator
+import os
 import struct
 import pyDes
 import usb.core
@@ -14,6 +17,103 @@ CF_ERASE_ZEROES = 0x10     # Erased blocks have all bits set to zero
 PLACEHOLDER_FOLDER_NAME = '..'
 PARENT_POINTER_FOLDER_NAME = '.'
 
+log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=4)
+def _blank_page(erased_byte: int, length: int) -> bytes:
+    return bytes([erased_byte]) * length
+
+def _verify_erased(page_data: bytes, erased_byte: int) -> bool:
+    """
+    Checks that a page reads back fully erased with one C-level
+    comparison against a cached blank-page constant.
+    """
+    return page_data == _blank_page(erased_byte, len(page_data))
+
+def _build_ecc_tables():
+    # Byte parity and the column-parity contribution of every byte value,
+    # computed once at import so the per-page ECC loop is pure table lookups
+    parity_table = [0] * 256
+    for value in range(256):
+        parity = 0
+        v = value
+        while v:
+            parity ^= 1
+            v &= v - 1
+        parity_table[value] = parity
+
+    cpmasks = (0x55, 0x33, 0x0F, 0x00, 0xAA, 0xCC, 0xF0)
+    column_parity_table = [0] * 256
+    for value in range(256):
+        mask = 0
+        for bit, cpmask in enumerate(cpmasks):
+            mask |= parity_table[value & cpmask] << bit
+        column_parity_table[value] = mask
+
+    return bytes(parity_table), bytes(column_parity_table)
+
+_ECC_PARITY_TABLE, _ECC_COLUMN_PARITY_TABLE = _build_ecc_tables()
+
+def compute_ecc(data: bytes) -> bytes:
+    """
+    Computes the PS2 ECC for a page of data: 3 bytes per 128-byte chunk,
+    zero-padded to a multiple of 8 (16 bytes for a 512-byte page).
+    Table-driven equivalent of the bit-by-bit parity construction.
+    """
+    parity_table = _ECC_PARITY_TABLE
+    column_table = _ECC_COLUMN_PARITY_TABLE
+    ecc = bytearray()
+    for chunk_start in range(0, len(data), 128):
+        column_parity = 0x77
+        line_parity_0 = 0x7F
+        line_parity_1 = 0x7F
+        for i in range(128):
+            b = data[chunk_start + i]
+            column_parity ^= column_table[b]
+            if parity_table[b]:
+                line_parity_0 ^= ~i
+                line_parity_1 ^= i
+        ecc += bytes((column_parity, line_parity_0 & 0x7F, line_parity_1))
+    ecc += bytes(-len(ecc) % 8)
+    return bytes(ecc)
+
+# PS2 datetime: [reserved][sec][min][hour][day][month][year lo][year hi]
+_DT = struct.Struct('<xBBBBBH')
+
+# Directory entry header: mode, length, created, cluster, modified, attr
+# (name and padding are handled separately); one unpack per entry
+_DIR_ENTRY = struct.Struct('<H2xI8sI4x8sI')
+
+# Superblock layout, precompiled so parsing is two C-level unpacks instead
+# of one struct.unpack call per field
+_SB_FIELDS = struct.Struct('<4H6I')   # 0x28: page_len .. backup_block2
+_SB_WORD_LIST = struct.Struct('<32I') # 0x50: IFC list / 0xD0: bad block list
+
+def _parse_superblock(superblock_info: bytes) -> dict:
+    """
+    Parses the raw superblock bytes according to the PS2 memory card
+    format and returns the field dict shared by both readers.
+    """
+    data = {}
+    # 0x00: Magic (28 bytes) - should be "Sony PS2 Memory Card Format "
+    data['magic'] = superblock_info[0x00:0x1C].decode('ascii', errors='ignore').rstrip('\x00')
+    # 0x1C: Version (12 bytes) - format version
+    data['version'] = superblock_info[0x1C:0x28].decode('ascii', errors='ignore').rstrip('\x00')
+    # 0x28: fixed-size geometry and layout fields
+    (data['page_len'], data['pages_per_cluster'], data['pages_per_block'],
+     data['unused_field'], data['clusters_per_card'], data['alloc_offset'],
+     data['alloc_end'], data['rootdir_cluster'], data['backup_block1'],
+     data['backup_block2']) = _SB_FIELDS.unpack_from(superblock_info, 0x28)
+    # 0x50: IFC list (32 words = 128 bytes)
+    data['ifc_list'] = list(_SB_WORD_LIST.unpack_from(superblock_info, 0x50))
+    # 0xD0: Bad block list (32 words = 128 bytes)
+    data['bad_block_list'] = list(_SB_WORD_LIST.unpack_from(superblock_info, 0xD0))
+    # 0x150: Card type (1 byte)
+    data['card_type'] = superblock_info[0x150]
+    # 0x151: Card flags (1 byte)
+    data['card_flags'] = superblock_info[0x151]
+    return data
+
 class Ps2MemoryCardReader(ABC):
     """
     Abstract interface for PS2 Memory Card reading operations.
@@ -57,6 +157,46 @@ class Ps2MemoryCardReader(ABC):
         """
         pass
 
+    def read_pages(self, start: int, count: int) -> bytes:
+        """
+        Reads a contiguous run of pages in one call.
+        Returns a single buffer with data followed by ECC for each page.
+        """
+        specs = self.get_card_specs()
+        page_size = specs['pagesize']
+        page_total_size = page_size + specs['eccsize']
+        buf = bytearray(count * page_total_size)
+        mv = memoryview(buf)
+        offset = 0
+        read_page = self.read_page
+        for number in range(start, start + count):
+            data, ecc = read_page(number)
+            mv[offset:offset + page_size] = data
+            mv[offset + page_size:offset + page_total_size] = ecc
+            offset += page_total_size
+        return bytes(buf)
+
+    def write_pages(self, start: int, data: bytes):
+        """
+        Writes a contiguous run of pages from a single buffer
+        laid out as data followed by ECC for each page.
+        """
+        # Written pages may hold FAT or directory data; drop both caches
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
+
+        specs = self.get_card_specs()
+        page_size = specs['pagesize']
+        page_total_size = page_size + specs['eccsize']
+        mv = memoryview(data)
+        count = len(data) // page_total_size
+        offset = 0
+        write_page = self.write_page
+        for number in range(start, start + count):
+            write_page(number, mv[offset:offset + page_size],
+                       mv[offset + page_size:offset + page_total_size])
+            offset += page_total_size
+
     @abstractmethod
     def generate_superblock_info(self) -> dict:
         """
@@ -107,6 +247,55 @@ class Ps2MemoryCardReader(ABC):
         """
         return bool(self.get_superblock_info()['card_flags'] & CF_ERASE_ZEROES)
 
+    # Assembled cluster buffers, keyed by cluster number; FAT walks and
+    # directory rescans revisit the same clusters, and on the physical
+    # reader every revisit would otherwise cost two USB page reads
+    cluster_cache = None
+
+    def read_cluster(self, cluster_num: int) -> bytes:
+        """
+        Reads the data pages of one cluster into a single buffer,
+        filled in place instead of concatenating per-page results.
+        Memoized until the card contents change.
+        """
+        cache = self.cluster_cache
+        if cache is None:
+            cache = self.cluster_cache = {}
+        data = cache.get(cluster_num)
+        if data is not None:
+            return data
+
+        superblock = self.get_superblock_info()
+        page_size = self.get_card_specs()['pagesize']
+        pages_per_cluster = superblock['pages_per_cluster']
+        first_page = cluster_num * pages_per_cluster
+
+        buf = bytearray(pages_per_cluster * page_size)
+        mv = memoryview(buf)
+        for i in range(pages_per_cluster):
+            mv[i * page_size:(i + 1) * page_size] = self.read_page(first_page + i)[0]
+        data = cache[cluster_num] = bytes(buf)
+        return data
+
+    # Decoded FAT/indirect clusters, keyed by cluster number; successive
+    # get_fat_entry calls in a chain walk mostly hit the same clusters
+    fat_cluster_cache = None
+
+    _FAT_CLUSTER = struct.Struct('<256I')
+
+    def _load_fat_cluster(self, cluster_num):
+        """
+        Reads and decodes one FAT or indirect cluster (256 little-endian
+        words), memoized until the card contents change.
+        """
+        cache = self.fat_cluster_cache
+        if cache is None:
+            cache = self.fat_cluster_cache = {}
+        words = cache.get(cluster_num)
+        if words is None:
+            words = cache[cluster_num] = self._FAT_CLUSTER.unpack(self.read_cluster(cluster_num))
+        return words
+
     def get_fat_entry(self, fat_cluster_index):
         """
         Resolve the FAT entry for a given cluster index on a PS2 memory card.
@@ -129,17 +318,13 @@ class Ps2MemoryCardReader(ABC):
 
         # Step 2: fetch the indirect cluster number from IFC table
         indirect_cluster_num = superblock['ifc_list'][dbl_indirect_idx]
-        indirect_cluster_page = indirect_cluster_num * superblock['pages_per_cluster']
-        indirect_data = self.read_page(indirect_cluster_page)[0] + self.read_page(indirect_cluster_page + 1)[0]
 
         # indirect cluster contains 256 little-endian cluster numbers
-        indirect_cluster = struct.unpack("<256I", indirect_data)
+        indirect_cluster = self._load_fat_cluster(indirect_cluster_num)
         fat_cluster_num = indirect_cluster[indirect_offset]
 
         # Step 3: read the FAT cluster itself
-        fat_cluster_page = fat_cluster_num * superblock['pages_per_cluster']
-        fat_data = self.read_page(fat_cluster_page)[0] + self.read_page(fat_cluster_page + 1)[0]
-        fat_cluster = struct.unpack("<256I", fat_data)
+        fat_cluster = self._load_fat_cluster(fat_cluster_num)
 
         # Step 4: extract the entry for our cluster
         entry = fat_cluster[fat_offset]
@@ -156,14 +341,8 @@ class Ps2MemoryCardReader(ABC):
             str: Formatted datetime string
         """
         try:
-            # PS2 datetime format: [reserved][sec][min][hour][day][month][year_low][year_high]
-            sec = dt_bytes[1]
-            minute = dt_bytes[2]
-            hour = dt_bytes[3]
-            day = dt_bytes[4]
-            month = dt_bytes[5]
-            year = struct.unpack('<H', dt_bytes[6:8])[0]
-            
+            sec, minute, hour, day, month, year = _DT.unpack(dt_bytes)
+
             if year == 0 or month == 0 or day == 0:
                 return "Unknown"
                 
@@ -171,41 +350,31 @@ class Ps2MemoryCardReader(ABC):
         except:
             return "Invalid"
 
-    def parse_directory_entry(self, entry_data):
+    def parse_directory_entry(self, entry_data, offset=0):
         """
         Parse a directory entry (512 bytes)
-        
+
         Args:
-            entry_data (bytes): 512 bytes of directory entry data
-            
+            entry_data (bytes): buffer holding the directory entry data
+            offset (int): position of the entry within the buffer
+
         Returns:
             dict: Parsed directory entry or None if empty
         """
-        if entry_data[0] == 0:  # Empty entry
+        if entry_data[offset] == 0:  # Empty entry
             return None
-        
+
         entry = {}
-        
-        # Mode (2 bytes)
-        entry['mode'] = struct.unpack('<H', entry_data[0:2])[0]
-        
-        # Length (4 bytes)
-        entry['length'] = struct.unpack('<I', entry_data[4:8])[0]
-        
-        # Created datetime (8 bytes)
-        entry['created'] = self.parse_datetime(entry_data[8:16])
-        
-        # Cluster (4 bytes) - relative to alloc_offset
-        entry['cluster'] = struct.unpack('<I', entry_data[16:20])[0]
-        
-        # Modified datetime (8 bytes)
-        entry['modified'] = self.parse_datetime(entry_data[24:32])
-        
-        # Attributes (4 bytes)
-        entry['attr'] = struct.unpack('<I', entry_data[32:36])[0]
-        
+
+        # The whole fixed-layout header comes out in one C-level unpack;
+        # cluster is relative to alloc_offset
+        (entry['mode'], entry['length'], created, entry['cluster'],
+         modified, entry['attr']) = _DIR_ENTRY.unpack_from(entry_data, offset)
+        entry['created'] = self.parse_datetime(created)
+        entry['modified'] = self.parse_datetime(modified)
+
         # Name (32 bytes, 0-terminated), stop after first 0x00
-        name_bytes = entry_data[64:96]
+        name_bytes = entry_data[offset + 64:offset + 96]
         # Find the first null terminator and slice up to that point
         null_pos = name_bytes.find(b'\x00')
         if null_pos != -1:
@@ -233,48 +402,50 @@ class Ps2MemoryCardReader(ABC):
     def get_directory_clusters(self, start_cluster):
         superblock_info = self.get_superblock_info()
         alloc_offset = superblock_info['alloc_offset']
+        ifc_list = superblock_info['ifc_list']
+        load_fat_cluster = self._load_fat_cluster
         directories = []
         cluster = start_cluster
         while True:
             directories.append(alloc_offset + cluster)
-            entry = self.get_fat_entry(cluster)
+            # Inline FAT lookup: with the decoded clusters memoized, each
+            # hop is two dict hits and an index into the cached words
+            indirect_index, fat_offset = divmod(cluster, 256)
+            dbl_indirect_idx, indirect_offset = divmod(indirect_index, 256)
+            indirect_cluster = load_fat_cluster(ifc_list[dbl_indirect_idx])
+            entry = load_fat_cluster(indirect_cluster[indirect_offset])[fat_offset]
             if entry == 0xFFFFFFFF:
                 break
             cluster = entry & 0x7FFFFFFF
         return directories
 
     def get_directory_content(self, parent_directory_cluster):
-        superblock = self.get_superblock_info()
         directories = self.get_directory_clusters(parent_directory_cluster)
+        is_root = parent_directory_cluster == self.get_root_directory_cluster()
         entries = []
         for cluster in directories:
-            cluster_page = cluster * superblock['pages_per_cluster']
-            entry_data = self.read_page(cluster_page)[0] + self.read_page(cluster_page + 1)[0]
-            first_entry = self.parse_directory_entry(entry_data[0:512])
-            second_entry = self.parse_directory_entry(entry_data[512:512+512])
-
-            if first_entry is not None and first_entry['name'] != PLACEHOLDER_FOLDER_NAME:
-                is_parent_directory = first_entry['name'] == PARENT_POINTER_FOLDER_NAME
-
+            entry_data = self.read_cluster(cluster)
+            # Each cluster holds exactly two 512-byte entries
+            for offset in (0, 512):
+                entry = self.parse_directory_entry(entry_data, offset)
+                if entry is None or entry['name'] == PLACEHOLDER_FOLDER_NAME:
+                    continue
+
+                is_parent_directory = entry['name'] == PARENT_POINTER_FOLDER_NAME
                 if is_parent_directory:
-                    first_entry['name'] = '<Parent Directory>'
-                if not is_parent_directory or (is_parent_directory and parent_directory_cluster != self.get_root_directory_cluster()):
-                    entries.append(first_entry)
-            if second_entry is not None and second_entry['name'] != PLACEHOLDER_FOLDER_NAME:
-                is_parent_directory = second_entry['name'] == PARENT_POINTER_FOLDER_NAME
-
-                if is_parent_directory:
-                    second_entry['name'] = '<Parent Directory>'
-                if not is_parent_directory or (is_parent_directory and parent_directory_cluster != self.get_root_directory_cluster()):
-                    entries.append(second_entry)
+                    entry['name'] = '<Parent Directory>'
+                if not is_parent_directory or not is_root:
+                    entries.append(entry)
         return entries
 
     def erase_all(self):
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
         superblock_info = self.get_card_specs()
         pages_per_card = superblock_info['cardsize']
 
         for i in range(pages_per_card):
-            print(f"Erasing page {i}", end="\r")
+            log.debug("Erasing page %d", i)
             self.erase_page(i)
 
     def read_file(self, file_cluster: int, size_in_bytes: int) -> bytes:
@@ -308,24 +479,67 @@ class VirtualPs2MemoryCardReader(Ps2MemoryCardReader):
     A virtual PS2 Memory Card reader that reads from a file.
     """
     memory_card_file = None
+    memory_card_map = None
+    card_specs = None
 
     def __init__(self, file_path: str):
         self.file_path = file_path
 
     def open(self) -> None:
+        self.superblock_cache = None
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
         self.memory_card_file = open(self.file_path, "rb")
-    
+        # Card images are consumed front-to-back; tell the kernel so it
+        # widens readahead on the file before we map it
+        if hasattr(os, 'posix_fadvise'):
+            fd = self.memory_card_file.fileno()
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        # Map the file so page reads are pure slicing backed by the page
+        # cache instead of a seek+read syscall pair per page
+        self.memory_card_map = mmap.mmap(self.memory_card_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self.memory_card_map, 'madvise'):
+            self.memory_card_map.madvise(mmap.MADV_SEQUENTIAL)
+
     def close(self) -> None:
+        self.memory_card_map.close()
+        self.memory_card_map = None
         self.memory_card_file.close()
-    
+        self.superblock_cache = None
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
+
     def read_page(self, number: int) -> tuple[bytes, bytes]:
         card_specs = self.get_card_specs()
-        page_size = card_specs['pagesize'] + card_specs['eccsize']
-        self.memory_card_file.seek(number * page_size)
+        page_total_size = card_specs['pagesize'] + card_specs['eccsize']
+        offset = number * page_total_size
         if card_specs['ecc']:
-            return self.memory_card_file.read(page_size - card_specs['eccsize']), self.memory_card_file.read(card_specs['eccsize'])
+            split = offset + card_specs['pagesize']
+            return self.memory_card_map[offset:split], self.memory_card_map[split:offset + page_total_size]
         else:
-            return self.memory_card_file.read(page_size), b''
+            return self.memory_card_map[offset:offset + page_total_size], b''
+
+    def read_pages(self, start: int, count: int) -> bytes:
+        # Contiguous pages are stored contiguously (data+ECC interleaved),
+        # so a bulk read is a single slice of the mapping
+        card_specs = self.get_card_specs()
+        page_total_size = card_specs['pagesize'] + card_specs['eccsize']
+        offset = start * page_total_size
+        return self.memory_card_map[offset:offset + count * page_total_size]
+
+    def read_cluster(self, cluster_num: int) -> bytes:
+        # Joins the data portions of the cluster's pages straight from
+        # the mapping, skipping the per-page read_page tuples entirely
+        card_specs = self.get_card_specs()
+        page_size = card_specs['pagesize']
+        page_total_size = page_size + card_specs['eccsize']
+        pages_per_cluster = self.get_superblock_info()['pages_per_cluster']
+        offset = cluster_num * pages_per_cluster * page_total_size
+        mm = self.memory_card_map
+        return b''.join(mm[offset + i * page_total_size:
+                           offset + i * page_total_size + page_size]
+                        for i in range(pages_per_cluster))
 
     def write_page(self, number: int, data: bytes, ecc: bytes):
         card_specs = self.get_card_specs()
@@ -346,56 +560,18 @@ class VirtualPs2MemoryCardReader(Ps2MemoryCardReader):
             self.memory_card_file.write(ecc)
     
     def generate_superblock_info(self) -> dict:
-        self.memory_card_file.seek(0)
-        superblock_info = self.memory_card_file.read(340)
-        # Parse the superblock according to PS2 memory card format
-        data = {}
-        # 0x00: Magic (28 bytes) - should be "Sony PS2 Memory Card Format "
-        data['magic'] = superblock_info[0x00:0x1C].decode('ascii', errors='ignore').rstrip('\x00')
-        # 0x1C: Version (12 bytes) - format version
-        data['version'] = superblock_info[0x1C:0x28].decode('ascii', errors='ignore').rstrip('\x00')
-        # 0x28: Page length (2 bytes, little-endian) - 512 bytes data + 16 bytes ECC = 528 total
-        data['page_len'] = struct.unpack('<H', superblock_info[0x28:0x2A])[0]
-        # 0x2A: Pages per cluster (2 bytes, little-endian)
-        data['pages_per_cluster'] = struct.unpack('<H', superblock_info[0x2A:0x2C])[0]
-        # 0x2C: Pages per block (2 bytes, little-endian)
-        data['pages_per_block'] = struct.unpack('<H', superblock_info[0x2C:0x2E])[0]
-        # 0x2E: Unused field (2 bytes, should be 0xFF00)
-        data['unused_field'] = struct.unpack('<H', superblock_info[0x2E:0x30])[0]
-        # 0x30: Clusters per card (4 bytes, little-endian)
-        data['clusters_per_card'] = struct.unpack('<I', superblock_info[0x30:0x34])[0]
-        # 0x34: Allocation offset (4 bytes, little-endian) - cluster offset of first allocatable cluster
-        data['alloc_offset'] = struct.unpack('<I', superblock_info[0x34:0x38])[0]
-        # 0x38: Allocation end (4 bytes, little-endian)
-        data['alloc_end'] = struct.unpack('<I', superblock_info[0x38:0x3C])[0]
-
-        # 0x3C: Root directory cluster (4 bytes, little-endian) - relative to alloc_offset
-        data['rootdir_cluster'] = struct.unpack('<I', superblock_info[0x3C:0x40])[0]
-
-        # 0x40: Backup block 1 (4 bytes, little-endian)
-        data['backup_block1'] = struct.unpack('<I', superblock_info[0x40:0x44])[0]
-
-        # 0x44: Backup block 2 (4 bytes, little-endian)
-        data['backup_block2'] = struct.unpack('<I', superblock_info[0x44:0x48])[0]
-        # 0x50: IFC list (32 words = 128 bytes)
-        data['ifc_list'] = []
-        for i in range(32):
-            offset = 0x50 + (i * 4)
-            value = struct.unpack('<I', superblock_info[offset:offset+4])[0]
-            data['ifc_list'].append(value)
-        
-        # 0xD0: Bad block list (32 words = 128 bytes)
-        data['bad_block_list'] = []
-        for i in range(32):
-            offset = 0xD0 + (i * 4)
-            value = struct.unpack('<I', superblock_info[offset:offset+4])[0]
-            data['bad_block_list'].append(value)
-        
-        # 0x150: Card type (1 byte)
-        data['card_type'] = superblock_info[0x150]
-        
-        # 0x151: Card flags (1 byte)
-        data['card_flags'] = superblock_info[0x151]
+        # The superblock lives in the first 340 bytes of the image
+        data = _parse_superblock(self.memory_card_map[:340])
+
+        # Everything below alloc_offset is metadata (superblock, IFC and
+        # FAT clusters); ask the kernel to prefetch it so the first chain
+        # walks don't fault it in one small read at a time
+        if hasattr(self.memory_card_map, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+            specs = self.get_card_specs()
+            length = (data['alloc_offset'] * data['pages_per_cluster']
+                      * (specs['pagesize'] + specs['eccsize']))
+            if 0 < length <= len(self.memory_card_map):
+                self.memory_card_map.madvise(mmap.MADV_WILLNEED, 0, length)
 
         return data
 
@@ -403,13 +579,24 @@ class VirtualPs2MemoryCardReader(Ps2MemoryCardReader):
         raise NotImplementedError("Erase block not implemented for virtual reader")
 
     def get_card_specs(self, refresh: bool = False) -> dict:
-        return {
-            'cardsize': 16384,
-            'blocksize': 16,
-            'pagesize': 512,
-            'eccsize': 16,
-            'ecc': True
-        }
+        # Built once per instance; read_page calls this on every page
+        if refresh or self.card_specs is None:
+            specs = {
+                'cardsize': 16384,
+                'blocksize': 16,
+                'pagesize': 512,
+                'eccsize': 16,
+                'ecc': True
+            }
+            # Some .ps2 images store bare 512-byte pages with no ECC
+            # spares; detect that from the image size so page and cluster
+            # reads become plain contiguous slices
+            if (self.memory_card_map is not None
+                    and len(self.memory_card_map) == specs['cardsize'] * specs['pagesize']):
+                specs['eccsize'] = 0
+                specs['ecc'] = False
+            self.card_specs = specs
+        return self.card_specs
 
 class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
     """
@@ -472,13 +659,25 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
     dev = None
     cardflags = None
     card_specs = None
+    wMaxPacketSize = None
+
+    # When False, read_page skips ECC verification/correction entirely;
+    # the GUI can toggle this for faster dumps
+    verify_ecc = True
+
+    # Packets for data-less commands are constant, so build each once and
+    # reuse it; CS_GET_READ_8 alone runs 66 times per page read
+    _static_packets = {}
+
+    _RESPONSE_MAGIC = bytearray([0x55, 0x5A])
 
     def request_response(self,command, data: list[int] = None, reverse: bool = True) -> tuple[list[int], int]:
-        wMaxPacketSize = self.dev[0][(0,0)][0].wMaxPacketSize
+        wMaxPacketSize = self.wMaxPacketSize
         payload = self.commands[command]
-        size = len(payload) + 3
-        packet = [0xAA, 0x42, size, 0x00, 0x81] + payload + [0x00, 0x00]
         if data:
+            size = len(payload) + 3
+            packet = [0xAA, 0x42, size, 0x00, 0x81] + payload + [0x00, 0x00]
+
             if len(data) != payload.count(0x00) - 1:
                 raise ValueError(command, "Data is not the correct length")
 
@@ -487,21 +686,29 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
 
             start = packet.index(0,5)
             packet = packet[:start] + data + [functools.reduce(operator.xor, data)] + packet[start+len(data)+1:]
+            flags_index = packet.index(0x00,5)
+        else:
+            cached = self._static_packets.get(command)
+            if cached is None:
+                size = len(payload) + 3
+                packet = [0xAA, 0x42, size, 0x00, 0x81] + payload + [0x00, 0x00]
+                cached = self._static_packets[command] = (packet, packet.index(0x00,5))
+            packet, flags_index = cached
 
         self.dev.write(0x02, packet)
         response = self.dev.read(0x81, wMaxPacketSize)
 
-        if response[:2] != bytearray([0x55, 0x5A]):
+        if response[:2] != self._RESPONSE_MAGIC:
             raise ValueError(command)
 
-        self.cardflags = response[packet.index(0x00,5)];
+        self.cardflags = response[flags_index];
 
         if "GET" in command:
             if reverse:
                 r = response[-2:-payload.count(0x00)-2:-1]
                 return r[1:], r[0]
             else:
-                s = packet.index(0x00,5)+1
+                s = flags_index+1
                 r = response[s:s+payload.count(0x00)]
                 return r[:-1], r[-1]
 
@@ -573,50 +780,20 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
 
         self.request_response("CS_IO_FIN")
 
-        if card_specs['ecc'] and old_ecc[-1] != card_specs['erased_byte']:
-            def parityOf(int_type):
-                parity = 1
-                while (int_type):
-                    parity = 1 - parity
-                    int_type = int_type & (int_type - 1)
-                return(str(parity))
+        if card_specs['ecc'] and self.verify_ecc and old_ecc[-1] != card_specs['erased_byte']:
+            new_ecc = compute_ecc(bytes(page))
 
             for j in range(card_specs['pagesize'] // 128):
-                line_parity = []
-                column_parity = 0xFF
-                for i in range(128):
-                    line_parity.append(parityOf(page[j*128+i]))
-                    column_parity = column_parity ^ page[j*128+i]
-
-                c = ['0','0']
-                for i in range(3):
-                    c.insert(1  , parityOf(column_parity & int("".join(itertools.islice(itertools.cycle(['1']*2**i + ['0']*2**i), 8)), 2)))
-                    c.insert(i+3, parityOf(column_parity & int("".join(itertools.islice(itertools.cycle(['0']*2**i + ['1']*2**i), 8)), 2)))
-
-                lo = []
-                le = []
-                for i in range(7):
-                    lo.append(parityOf(int("".join(itertools.compress(line_parity, itertools.cycle([1]*2**i + [0]*2**i))), 2)))
-                    le.append(parityOf(int("".join(itertools.compress(line_parity, itertools.cycle([0]*2**i + [1]*2**i))), 2)))
-
-                new_ecc = [int("".join(c), 2), int("".join(lo[::-1]), 2), int("".join(le[::-1]), 2)]
-
-                def countSetBits(n):
-                    if (n == 0):
-                        return 0
-                    else:
-                        return (n & 1) + countSetBits(n >> 1)
-
                 # Detect errors
-                test_ecc = [a ^ b for a, b in zip(old_ecc[j*3:j*3+3], new_ecc)]
-                bits = sum(countSetBits(n) for n in test_ecc)
+                test_ecc = [a ^ b for a, b in zip(old_ecc[j*3:j*3+3], new_ecc[j*3:j*3+3])]
+                bits = sum(n.bit_count() for n in test_ecc)
                 if bits == 10:
-                    print("Data Error")
+                    log.warning("Data error corrected in page %d chunk %d", num, j)
                     page[(j*128)+(127-test_ecc[1])] ^= 1 << (test_ecc[0] >> 4)
                     # TODO commit page
                 elif bits == 1:
-                    print("ECC Error")
-                    old_ecc[j*3:j*3+3] = new_ecc
+                    log.warning("ECC error corrected in page %d chunk %d", num, j)
+                    old_ecc[j*3:j*3+3] = new_ecc[j*3:j*3+3]
                     # TODO commit ecc
                 elif bits != 0:
                     pass
@@ -632,23 +809,31 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
         if self.has_ecc_support() and ecc is None:
             raise ValueError("write page no ecc")
 
+        data = list(data)
         self.request_response("CS_PUT_WRITE_INDEX", data=list(struct.pack(">I", num)))
         for i in range(card_specs['pagesize'] // 8):
-            self.request_response("CS_PUT_WRITE_8", data=list(data)[i*8:i*8+8], reverse=False)
+            self.request_response("CS_PUT_WRITE_8", data=data[i*8:i*8+8], reverse=False)
 
         if self.has_ecc_support():
+            ecc = list(ecc)
             # chunks are 128 bytes, 3 bytes per ecc, 4 byte padding
             for i in range(((card_specs['pagesize'] // 128) * 3 + 4) // 8):
-                self.request_response("CS_PUT_WRITE_8", data=list(ecc)[i*8:i*8+8], reverse=False)
+                self.request_response("CS_PUT_WRITE_8", data=ecc[i*8:i*8+8], reverse=False)
 
         self.request_response("CS_IO_FIN")
 
     def open(self) -> None:
+        self.superblock_cache = None
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
         self.dev = usb.core.find(idVendor=0x054c, idProduct=0x02ea)
         if self.dev is None:
             raise ValueError("ps3mca is not connected")
         self.dev.set_configuration()
-    
+        # The endpoint descriptor never changes while the device is open,
+        # so resolve the packet size once instead of per command
+        self.wMaxPacketSize = self.dev[0][(0,0)][0].wMaxPacketSize
+
         retries = 0
         while retries < 5:
             try:   
@@ -664,65 +849,16 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
     def close(self) -> None:
         usb.util.dispose_resources(self.dev)
         self.dev = None
+        self.card_specs = None
+        self.superblock_cache = None
+        self.fat_cluster_cache = None
+        self.cluster_cache = None
     
     def generate_superblock_info(self) -> dict:
+        # The superblock spans the first two pages of the card
         page0, ecc0 = self.read_page(0)
         page1, ecc1 = self.read_page(1)
-
-        page0 = bytes(page0)
-        page1 = bytes(page1)
-
-        superblock_info = page0 + page1
-        # Parse the superblock according to PS2 memory card format
-        data = {}
-        # 0x00: Magic (28 bytes) - should be "Sony PS2 Memory Card Format "
-        data['magic'] = superblock_info[0x00:0x1C].decode('ascii', errors='ignore').rstrip('\x00')
-        # 0x1C: Version (12 bytes) - format version
-        data['version'] = superblock_info[0x1C:0x28].decode('ascii', errors='ignore').rstrip('\x00')
-        # 0x28: Page length (2 bytes, little-endian) - 512 bytes data + 16 bytes ECC = 528 total
-        data['page_len'] = struct.unpack('<H', superblock_info[0x28:0x2A])[0]
-        # 0x2A: Pages per cluster (2 bytes, little-endian)
-        data['pages_per_cluster'] = struct.unpack('<H', superblock_info[0x2A:0x2C])[0]
-        # 0x2C: Pages per block (2 bytes, little-endian)
-        data['pages_per_block'] = struct.unpack('<H', superblock_info[0x2C:0x2E])[0]
-        # 0x2E: Unused field (2 bytes, should be 0xFF00)
-        data['unused_field'] = struct.unpack('<H', superblock_info[0x2E:0x30])[0]
-        # 0x30: Clusters per card (4 bytes, little-endian)
-        data['clusters_per_card'] = struct.unpack('<I', superblock_info[0x30:0x34])[0]
-        # 0x34: Allocation offset (4 bytes, little-endian) - cluster offset of first allocatable cluster
-        data['alloc_offset'] = struct.unpack('<I', superblock_info[0x34:0x38])[0]
-        # 0x38: Allocation end (4 bytes, little-endian)
-        data['alloc_end'] = struct.unpack('<I', superblock_info[0x38:0x3C])[0]
-
-        # 0x3C: Root directory cluster (4 bytes, little-endian) - relative to alloc_offset
-        data['rootdir_cluster'] = struct.unpack('<I', superblock_info[0x3C:0x40])[0]
-
-        # 0x40: Backup block 1 (4 bytes, little-endian)
-        data['backup_block1'] = struct.unpack('<I', superblock_info[0x40:0x44])[0]
-
-        # 0x44: Backup block 2 (4 bytes, little-endian)
-        data['backup_block2'] = struct.unpack('<I', superblock_info[0x44:0x48])[0]
-        # 0x50: IFC list (32 words = 128 bytes)
-        data['ifc_list'] = []
-        for i in range(32):
-            offset = 0x50 + (i * 4)
-            value = struct.unpack('<I', superblock_info[offset:offset+4])[0]
-            data['ifc_list'].append(value)
-        
-        # 0xD0: Bad block list (32 words = 128 bytes)
-        data['bad_block_list'] = []
-        for i in range(32):
-            offset = 0xD0 + (i * 4)
-            value = struct.unpack('<I', superblock_info[offset:offset+4])[0]
-            data['bad_block_list'].append(value)
-        
-        # 0x150: Card type (1 byte)
-        data['card_type'] = superblock_info[0x150]
-        
-        # 0x151: Card flags (1 byte)
-        data['card_flags'] = superblock_info[0x151]
-
-        return data
+        return _parse_superblock(page0 + page1)
 
     def get_card_specs(self, refresh: bool = False):
         if refresh or self.card_specs is None:
@@ -737,4 +873,24 @@ class PhysicalPs2MemoryCardReader(Ps2MemoryCardReader):
     def erase_page(self, number: int):
         self.request_response("CS_PUT_ERASE_INDEX", data=list(struct.pack(">I", number)))
         self.request_response("CS_ERASE_CONFIRM")
-        self.request_response("CS_ERASE_FIN")
\ No newline at end of file
+        self.request_response("CS_ERASE_FIN")
+
+    def wait_erase_complete(self, timeout: float = 10):
+        """
+        Polls the card until page 0 reads back as erased, backing off
+        from 10 ms to 200 ms between probes. Returns early as soon as
+        the erase has settled instead of sleeping a fixed interval.
+        """
+        specs = self.get_card_specs()
+        erased_byte = specs['erased_byte']
+        deadline = monotonic() + timeout
+        delay = 0.01
+        while monotonic() < deadline:
+            try:
+                data, _ = self.read_page(0)
+                if _verify_erased(data, erased_byte):
+                    return
+            except Exception:
+                pass
+            sleep(delay)
+            delay = min(delay * 2, 0.2)
\ No newline at end of file
@@ -4,13 +4,53 @@ PS2 Memory Card Reader GUI
 A modern interface for reading both physical and virtual PS2 memory cards
 """
 
-from time import sleep
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import threading
+import collections
+import concurrent.futures
+import logging
+import operator
 import os
+import queue
+import threading
 from memory_card_reader import PhysicalPs2MemoryCardReader, VirtualPs2MemoryCardReader
 
+log = logging.getLogger(__name__)
+
+# (icon, type label) rows indexed by entry kind: dir, PS1, PocketStation, file
+_TYPE_TABLE = (("📁", "DIR"), ("🎮", "PS1"), ("📱", "PS"), ("📄", "FILE"))
+
+# Card info popup text, filled with format_map from the superblock dict
+# plus the computed size/feature fields
+_CARD_INFO_TMPL = """🎮 PS2 Memory Card - {size_mb:.1f} MB
+{rule}
+
+📊 SPECIFICATIONS
+  Size: {size_mb:.1f} MB ({clusters_per_card:,} clusters)
+  Format: {magic} v{version}
+  Page Size: {page_len} bytes
+  Block Size: {pages_per_block} pages
+
+🔧 FEATURES
+  ECC Support: {ecc}
+  Bad Block Management: {bad_blocks}
+  Erase Mode: {erase_mode}
+
+📁 STRUCTURE
+  Root Directory: Cluster {rootdir_cluster}
+  Allocation Range: {alloc_offset} - {alloc_end}
+  Backup Blocks: {backup_block1}, {backup_block2}
+"""
+
+def _row_for_entry(entry):
+    """Build the (text, values) pair displayed for a directory entry"""
+    is_dir = entry['is_dir']
+    idx = 0 if is_dir else 1 if entry['is_ps1'] else 2 if entry['is_pocketstation'] else 3
+    type_icon, type_text = _TYPE_TABLE[idx]
+    size_str = "<DIR>" if is_dir else format(entry['length'], ',')
+    return (f"{type_icon} {entry['name']}",
+            (type_text, size_str, entry['created'], entry['modified']))
+
 class Ps2MemoryCardGUI:
     def __init__(self, root):
         self.root = root
@@ -75,9 +115,31 @@ class Ps2MemoryCardGUI:
         self.is_physical = False
         self.conn_var = tk.StringVar(value="virtual")
         self.file_path_var = tk.StringVar()
+        self.skip_ecc_var = tk.BooleanVar(value=False)
+        self.fast_erase_var = tk.BooleanVar(value=False)
         
         # Dictionary to store hidden data for tree items
         self.tree_item_data = {}
+
+        # Pool of reusable Treeview item IDs, updated in place on repopulate
+        self._tree_item_pool = []
+
+        # Shared worker pool reused by all card operations (connect/dump/load/erase)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+        # Latest worker progress, polled by the Tk thread at ~20 Hz
+        self._progress_shared = None
+        self._progress_applied = None
+        self._progress_job = None
+
+        # Card info cached at connect time so UI refreshes don't hit the
+        # card, including the pre-rendered info popup text
+        self._superblock = None
+        self._caps = None
+        self._card_info_text = None
+
+        # Directory contents cached per cluster; invalidated on writes
+        self._dir_cache = {}
         
         self.setup_menu_bar()
         self.setup_ui()
@@ -111,6 +173,8 @@ class Ps2MemoryCardGUI:
                             activeforeground=self.colors['text_primary'])
         menubar.add_cascade(label="Tools", menu=self.tools_menu)
         self.tools_menu.add_command(label="📊 Card Information", command=self.show_card_info_popup)
+        self.tools_menu.add_checkbutton(label="⚡ Fast Dump (skip ECC verification)", variable=self.skip_ecc_var)
+        self.tools_menu.add_checkbutton(label="⚡ Fast Erase (skip blank pages)", variable=self.fast_erase_var)
         
         # Initialize tools menu state
         self.update_tools_menu_state()
@@ -243,8 +307,9 @@ class Ps2MemoryCardGUI:
         # Bind double-click event for folder navigation
         self.dir_tree.bind('<Double-1>', self.on_tree_double_click)
         
-        # Navigation state variables
-        self.navigation_stack = []
+        # Navigation state variables; history is bounded so a long browsing
+        # session can't grow the stack without limit
+        self.navigation_stack = collections.deque(maxlen=64)
         self.current_directory = None
         
     def setup_status_bar(self, parent):
@@ -300,36 +365,15 @@ class Ps2MemoryCardGUI:
                                                   selectforeground=self.colors['text_primary'])
         card_info_text.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Load card information
+        # The text was rendered off the Tk thread at connect time; falling
+        # back to a fresh render only happens if that failed (e.g. the card
+        # was unformatted when it was connected)
         try:
-            superblock = self.current_reader.get_superblock_info()
-            
-            # Calculate total size
-            total_size_mb = (superblock['clusters_per_card'] * superblock['pages_per_cluster'] * 528) / (1024*1024)
-            
-            info_text = f"""🎮 PS2 Memory Card - {total_size_mb:.1f} MB
-{'─' * 60}
-
-📊 SPECIFICATIONS
-  Size: {total_size_mb:.1f} MB ({superblock['clusters_per_card']:,} clusters)
-  Format: {superblock['magic']} v{superblock['version']}
-  Page Size: {superblock['page_len']} bytes
-  Block Size: {superblock['pages_per_block']} pages
-
-🔧 FEATURES
-  ECC Support: {'✓' if self.current_reader.has_ecc_support() else '✗'}
-  Bad Block Management: {'✓' if self.current_reader.has_bad_blocks() else '✗'}
-  Erase Mode: {'Zero' if self.current_reader.erased_blocks_are_zeroes() else 'One'}
-
-📁 STRUCTURE
-  Root Directory: Cluster {superblock['rootdir_cluster']}
-  Allocation Range: {superblock['alloc_offset']} - {superblock['alloc_end']}
-  Backup Blocks: {superblock['backup_block1']}, {superblock['backup_block2']}
-"""
-            
-            card_info_text.insert(1.0, info_text)
+            if self._card_info_text is None:
+                self.refresh_card_info()
+            card_info_text.insert(1.0, self._card_info_text)
             card_info_text.config(state=tk.DISABLED)
-            
+
         except Exception as e:
             card_info_text.insert(1.0, f"Error loading card info: {str(e)}")
             card_info_text.config(state=tk.DISABLED)
@@ -458,20 +502,22 @@ class Ps2MemoryCardGUI:
         """Connect to physical memory card"""
         self.status_var.set("Connecting to physical memory card...")
         
-        def connect_thread():
-            try:
-                self.current_reader = PhysicalPs2MemoryCardReader()
-                self.current_reader.open()
-                self.is_physical = True
-                
-                # Update UI in main thread
-                self.root.after(0, self.on_connection_success)
-                
-            except Exception as e:
-                error_msg = str(e)  # Capture the error message
-                self.root.after(0, lambda: self.on_connection_error(error_msg))
-                
-        threading.Thread(target=connect_thread, daemon=True).start()
+        def connect_task():
+            self.current_reader = PhysicalPs2MemoryCardReader()
+            self.current_reader.open()
+            self.is_physical = True
+            self._cache_card_info()
+
+        future = self._executor.submit(connect_task)
+        future.add_done_callback(lambda f: self.root.after(0, self._finalize_connect, f))
+
+    def _finalize_connect(self, future):
+        """Handle a finished connect future on the Tk main thread"""
+        error = future.exception()
+        if error:
+            self.on_connection_error(str(error))
+        else:
+            self.on_connection_success()
         
     def connect_virtual(self):
         """Connect to virtual memory card file"""
@@ -484,21 +530,57 @@ class Ps2MemoryCardGUI:
             return
             
         self.status_var.set("Loading virtual memory card...")
-        
-        try:
+
+        def connect_task():
             self.current_reader = VirtualPs2MemoryCardReader(self.current_file_path)
             self.current_reader.open()
             self.is_physical = False
+            self._cache_card_info()
+
+        future = self._executor.submit(connect_task)
+        future.add_done_callback(lambda f: self.root.after(0, self._finalize_connect, f))
             
-            self.on_connection_success()
-            
-        except Exception as e:
-            self.on_connection_error(str(e))
-            
+    def refresh_card_info(self):
+        """Re-query the reader and re-cache the superblock and capability flags.
+
+        Safe to call from a worker thread: it only touches the reader and
+        plain attributes, never Tk widgets.
+        """
+        self.current_reader.superblock_cache = None
+        superblock = self._superblock = self.current_reader.get_superblock_info()
+        ecc_support, bad_blocks, erase_zeroes = self._caps = (
+            self.current_reader.has_ecc_support(),
+            self.current_reader.has_bad_blocks(),
+            self.current_reader.erased_blocks_are_zeroes())
+
+        # Pre-render the info popup text so showing it later costs nothing
+        total_size_mb = (superblock['clusters_per_card'] * superblock['pages_per_cluster'] * 528) / (1024*1024)
+        self._card_info_text = _CARD_INFO_TMPL.format_map({
+            **superblock,
+            'size_mb': total_size_mb,
+            'rule': '─' * 60,
+            'ecc': '✓' if ecc_support else '✗',
+            'bad_blocks': '✓' if bad_blocks else '✗',
+            'erase_mode': 'Zero' if erase_zeroes else 'One',
+        })
+        return self._superblock
+
+    def _cache_card_info(self):
+        """Cache card info at connect time; an unformatted card is not fatal"""
+        try:
+            self.refresh_card_info()
+        except Exception:
+            self._superblock = None
+            self._caps = None
+            self._card_info_text = None
+
     def on_connection_success(self):
         """Handle successful connection"""
         self.status_var.set("Connected successfully! Loading directory...")
-        
+
+        # Fresh card, fresh caches (card info was cached by the connect task)
+        self._dir_cache.clear()
+
         # Load directory listing
         self.load_directory_listing()
         
@@ -521,16 +603,23 @@ class Ps2MemoryCardGUI:
             
         self.current_file_path = None
         self.is_physical = False
-        
+
+        # Invalidate the connect-time card info and directory caches
+        self._superblock = None
+        self._caps = None
+        self._card_info_text = None
+        self._dir_cache.clear()
+
         # Reset UI
         
         # Hide progress bar
         self.progress_frame.pack_forget()
         
-        # Clear all items from the tree
-        for item in self.dir_tree.get_children():
-            self.dir_tree.delete(item)
-        
+        # Drop the pooled tree items (detached ones are not in get_children)
+        if self._tree_item_pool:
+            self.dir_tree.delete(*self._tree_item_pool)
+            self._tree_item_pool = []
+
         # Clear the hidden data dictionary
         self.tree_item_data.clear()
             
@@ -540,66 +629,75 @@ class Ps2MemoryCardGUI:
             
         self.status_var.set("Disconnected")
               
-    def load_directory_listing(self):
-        """Load and display directory listing"""
+    def load_directory_listing(self, cluster=None):
+        """Load and display the directory listing for a cluster (root by default)"""
+        def scan_task():
+            target = cluster
+            if target is None:
+                target = self.current_reader.get_root_directory_cluster()
+
+            # Get directory entries (cached per cluster, so revisiting a
+            # directory doesn't re-walk the FAT on the card)
+            entries = self._dir_cache.get(target)
+            if entries is None:
+                entries = self.current_reader.get_directory_content(target)
+
+            # Sort entries by name in ascending order (decorate-sort-undecorate:
+            # lowercase each name once instead of once per comparison)
+            keyed = [(entry['name'].lower(), entry) for entry in entries if entry]
+            keyed.sort(key=operator.itemgetter(0))
+
+            # Format display rows here too, so the Tk thread only has to
+            # push finished strings into the widget
+            rows = [(entry, _row_for_entry(entry)) for _, entry in keyed]
+            return target, entries, rows
+
+        # Scan on the worker pool; card reads must not block the Tk thread
+        future = self._executor.submit(scan_task)
+        future.add_done_callback(lambda f: self.root.after(0, self._finalize_directory_listing, f))
+
+    def _finalize_directory_listing(self, future):
+        """Apply a finished directory scan to the tree on the Tk main thread"""
+        error = future.exception()
+        if error:
+            messagebox.showerror("Directory Error", f"Failed to load directory: {str(error)}")
+            return
+
+        cluster, entries, rows = future.result()
+        self._dir_cache[cluster] = entries
+        self._populate_tree(cluster, rows)
+
+    def _populate_tree(self, cluster, rows):
+        """Display pre-formatted (entry, (text, values)) rows for a cluster"""
+        # Clear the hidden data dictionary
+        self.tree_item_data.clear()
+
+        # Hide the data columns while rows churn so Tk doesn't relayout
+        # the view once per updated row
+        self.dir_tree.configure(displaycolumns=())
         try:
-            # Clear existing items
-            for item in self.dir_tree.get_children():
-                self.dir_tree.delete(item)
-            
-            # Clear the hidden data dictionary
-            self.tree_item_data.clear()
-                
-            # Get root directory cluster
-            root_cluster = self.current_reader.get_root_directory_cluster()
-            
-            # Get directory entries
-            entries = self.current_reader.get_directory_content(root_cluster)
-            
-            # Sort entries by name in ascending order
-            entries = sorted(entries, key=lambda x: x['name'].lower() if x and x['name'] else '')
-            
-            # Populate tree
-            for entry in entries:
-                if entry:  # Skip None entries
-                    # Type icon
-                    if entry['is_dir']:
-                        type_icon = "📁"
-                        type_text = "DIR"
-                        #if entry['is_hidden']:
-                        #    type_text = f"{type_text} [HIDDEN]"
-                    elif entry['is_ps1']:
-                        type_icon = "🎮"
-                        type_text = "PS1"
-                    elif entry['is_pocketstation']:
-                        type_icon = "📱"
-                        type_text = "PS"
-                    else:
-                        type_icon = "📄"
-                        type_text = "FILE"
-                    
-                    # Size formatting
-                    if entry['is_dir']:
-                        size_str = "<DIR>"
-                    else:
-                        size_str = f"{entry['length']:,}"
-                    
-                    # Name with hidden indicator
-                    name = entry['name']
-                    
-                    # Insert into tree
-                    item = self.dir_tree.insert('', 'end', text=f"{type_icon} {name}", 
-                                              values=(type_text, size_str, entry['created'], entry['modified']))
-                    
-                    # Store additional hidden data in dictionary
-                    self.tree_item_data[item] = entry  # Store the entire entry dict
-                    
-            # Update current directory label
-            self.current_directory = root_cluster
-            self.current_dir_label.config(text=f"📁 Current Directory: Cluster {root_cluster}")
-            
-        except Exception as e:
-            messagebox.showerror("Directory Error", f"Failed to load directory: {str(e)}")
+            # Grow the item pool with blank rows as needed
+            while len(self._tree_item_pool) < len(rows):
+                self._tree_item_pool.append(self.dir_tree.insert('', 'end'))
+
+            # Update the pooled items in place and reattach them in display order
+            for index, (entry, (text, values)) in enumerate(rows):
+                item = self._tree_item_pool[index]
+                self.dir_tree.item(item, text=text, values=values)
+                self.dir_tree.move(item, '', index)
+
+                # Store additional hidden data in dictionary
+                self.tree_item_data[item] = entry
+
+            # Detach (not delete) any leftover pooled items for later reuse
+            for item in self._tree_item_pool[len(rows):]:
+                self.dir_tree.detach(item)
+        finally:
+            self.dir_tree.configure(displaycolumns='#all')
+
+        # Update current directory label
+        self.current_directory = cluster
+        self.current_dir_label.config(text=f"📁 Current Directory: Cluster {cluster}")
 
     def on_tree_double_click(self, event):
         """Handle double-click on the directory tree to navigate into folders"""
@@ -650,107 +748,26 @@ class Ps2MemoryCardGUI:
             messagebox.showwarning("Not Connected", "Please connect to a memory card first.")
             return
             
-        try:
-            # Store current directory in navigation stack
-            if self.current_directory is not None:
-                self.navigation_stack.append(self.current_directory)
-            
-            # Navigate to the new directory using existing method
-            entries = self.current_reader.get_directory_content(cluster_num)
-            
-            if entries:
-                # Update current directory
-                self.current_directory = cluster_num
-                
-                # Clear and repopulate the tree
-                self.populate_directory_tree(entries)
-                
-                # Update status and current directory label
-                self.status_var.set(f"📁 Navigated to directory cluster {cluster_num}")
-                self.current_dir_label.config(text=f"📁 Current Directory: Cluster {cluster_num}")
-            else:
-                messagebox.showinfo("Empty Directory", f"Directory cluster {cluster_num} is empty or could not be read.")
-                
-        except Exception as e:
-            messagebox.showerror("Navigation Error", f"Failed to navigate to cluster {cluster_num}: {str(e)}")
-            self.status_var.set(f"Navigation failed: {str(e)}")
+        # Store current directory in navigation stack
+        if self.current_directory is not None:
+            self.navigation_stack.append(self.current_directory)
+
+        # Navigate to the new directory via the shared listing path
+        self.load_directory_listing(cluster_num)
+        self.status_var.set(f"📁 Navigated to directory cluster {cluster_num}")
     
     def navigate_back(self):
         """Navigate back to the previous directory"""
         if not self.navigation_stack:
             return
             
-        try:
-            # Get previous directory from stack
-            previous_cluster = self.navigation_stack.pop()
-            
-            # Navigate back using existing method
-            entries = self.current_reader.get_directory_content(previous_cluster)
-            
-            if entries:
-                # Update current directory
-                self.current_directory = previous_cluster
-                
-                # Clear and repopulate the tree
-                self.populate_directory_tree(entries)
-                
-                # Update status and current directory label
-                self.status_var.set(f"⬅️ Navigated back to cluster {previous_cluster}")
-                self.current_dir_label.config(text=f"📁 Current Directory: Cluster {previous_cluster}")
-            else:
-                messagebox.showinfo("Navigation Error", f"Could not navigate back to cluster {previous_cluster}")
-                
-        except Exception as e:
-            messagebox.showerror("Navigation Error", f"Failed to navigate back: {str(e)}")
-            self.status_var.set(f"Navigation failed: {str(e)}")
-    
-    def populate_directory_tree(self, entries):
-        """Populate the directory tree with entries"""
-        # Clear existing items
-        for item in self.dir_tree.get_children():
-            self.dir_tree.delete(item)
-        
-        # Clear the hidden data dictionary
-        self.tree_item_data.clear()
-        
-        # Sort entries by name in ascending order
-        entries = sorted(entries, key=lambda x: x['name'].lower() if x and x['name'] else '')
-        
-        # Populate tree with new entries
-        for entry in entries:
-            if entry:
-                # Type icon and text
-                if entry['is_dir']:
-                    type_icon = "📁"
-                    type_text = "DIR"
-                    #if entry['is_hidden']:
-                    #    type_text = f"{type_text} [HIDDEN]"
-                elif entry['is_ps1']:
-                    type_icon = "🎮"
-                    type_text = "PS1"
-                elif entry['is_pocketstation']:
-                    type_icon = "📱"
-                    type_text = "PS"
-                else:
-                    type_icon = "📄"
-                    type_text = "FILE"
-                
-                # Size formatting
-                if entry['is_dir']:
-                    size_str = "<DIR>"
-                else:
-                    size_str = f"{entry['length']:,}"
-                
-                # Name
-                name = entry['name']
-                
-                # Insert into tree
-                item = self.dir_tree.insert('', 'end', text=f"{type_icon} {name}", 
-                                   values=(type_text, size_str, entry['created'], entry['modified']))
-                
-                # Store additional hidden data in dictionary
-                self.tree_item_data[item] = entry
+        # Get previous directory from stack
+        previous_cluster = self.navigation_stack.pop()
 
+        # Navigate back via the shared listing path
+        self.load_directory_listing(previous_cluster)
+        self.status_var.set(f"⬅️ Navigated back to cluster {previous_cluster}")
+    
     def dump_physical_card(self):
         """Dump the physical memory card to a .ps2 file"""
         if not self.current_reader or not self.is_physical:
@@ -774,44 +791,90 @@ class Ps2MemoryCardGUI:
             self.progress_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
             self.progress_bar['value'] = 0
             
-            # Run dump in background thread
-            def dump_thread():
-                try:
-                    # Get card specifications
-                    specs = self.current_reader.get_card_specs()
-                    total_pages = specs['cardsize']
-                    
-                    with open(file_path, 'wb') as f:
-                        # Dump all pages
-                        for page_num in range(total_pages):
+            # Run dump on the shared worker pool
+            def dump_task():
+                # Get card specifications
+                specs = self.current_reader.get_card_specs()
+                total_pages = specs['cardsize']
+
+                # Read pages in batches to amortize per-page call overhead;
+                # each batch arrives as one buffer ready to be written out
+                batch_pages = 64
+
+                # Pipeline USB reads against file writes through a bounded
+                # queue so neither side idles waiting on the other
+                page_queue = queue.Queue(maxsize=16)
+
+                def produce_pages():
+                    # Hoist loop invariants out of the per-batch path
+                    read_pages = self.current_reader.read_pages
+                    put = page_queue.put
+                    try:
+                        for start in range(0, total_pages, batch_pages):
+                            count = min(batch_pages, total_pages - start)
                             try:
-                                cluster_data, ecc = self.current_reader.read_page(page_num)
-                                
-                                # Write page data
-                                f.write(bytes(cluster_data) + bytes(ecc))
-                                
-                                # Update progress bar
-                                progress = ((page_num + 1) / total_pages) * 100
-                                self.root.after(0, lambda p=progress: self.update_progress("Dumping memory card", p, page_num + 1, total_pages))
-                                    
+                                put((start + count, read_pages(start, count)))
                             except Exception as e:
-                                print(f"Error reading page {page_num}: {e}")
-                                # Continue with next page
+                                log.warning("pages %d-%d read error: %s", start, start + count - 1, e)
+                                # Continue with next batch
                                 continue
-                    
-                    # Success message
-                    self.root.after(0, lambda: self.on_dump_success(file_path))
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    self.root.after(0, lambda: self.on_dump_error(error_msg))
-                    
-            threading.Thread(target=dump_thread, daemon=True).start()
-            
+                    finally:
+                        put(None)
+
+                # The producer gets its own thread: parking it on the shared
+                # pool could leave two consumers holding both workers with
+                # their producers stuck behind them in the pool queue
+                reader_thread = threading.Thread(target=produce_pages, daemon=True)
+                reader_thread.start()
+
+                # A 1 MiB buffer coalesces the ~33 KiB batch writes into
+                # large sequential disk writes (the 8 KiB default is too
+                # small, huge buffers buy nothing)
+                with open(file_path, 'wb', buffering=1 << 20) as f:
+                    # Drain batches until the producer posts its sentinel
+                    while True:
+                        item = page_queue.get()
+                        if item is None:
+                            break
+                        pages_done, chunk = item
+                        f.write(chunk)
+
+                        # Publish progress; the Tk-side poller picks it up
+                        self._progress_shared = ("Dumping memory card", pages_done, total_pages)
+
+                    # Push the dump to stable storage before reporting
+                    # success, so a crash right after can't lose it
+                    f.flush()
+                    if hasattr(os, 'fdatasync'):
+                        os.fdatasync(f.fileno())
+
+                reader_thread.join()
+
+                # stat() the result here, not in the Tk-side handler
+                return file_path, os.path.getsize(file_path)
+
+            # Honor the fast-dump toggle for this operation only
+            self.current_reader.verify_ecc = not self.skip_ecc_var.get()
+
+            self._start_progress_poll()
+            future = self._executor.submit(dump_task)
+            future.add_done_callback(lambda f: self.root.after(0, self._finalize_dump, f))
+
         except Exception as e:
             messagebox.showerror("Dump Error", f"Failed to start dump: {str(e)}")
             self.status_var.set("Dump failed")
 
+    def _finalize_dump(self, future):
+        """Handle a finished dump future on the Tk main thread"""
+        self._stop_progress_poll()
+        if self.current_reader:
+            self.current_reader.verify_ecc = True
+        error = future.exception()
+        if error:
+            self.on_dump_error(str(error))
+        else:
+            self.on_dump_success(*future.result())
+
     def load_to_physical_card(self):
         """Load a .ps2 file to the physical memory card"""
         if not self.current_reader or not self.is_physical:
@@ -839,85 +902,156 @@ class Ps2MemoryCardGUI:
             self.progress_bar['value'] = 0
             self.progress_label.config(text="Loading memory card from file...")
             
-            # Run load in background thread
-            def load_thread():
-                try:
-                    # Create virtual reader for source file
-                    virtual_reader = VirtualPs2MemoryCardReader(file_path)
-                    virtual_reader.open()
-                    
-                    # Get card specifications from both readers
-                    physical_specs = self.current_reader.get_card_specs()
-
-                    virtual_specs = virtual_reader.get_card_specs()
-                    
-                    # Check compatibility
-                    if (self.current_reader.is_formatted() and (physical_specs['cardsize'] != virtual_specs['cardsize'] or
-                        physical_specs['blocksize'] != virtual_specs['blocksize'] or
-                        physical_specs['pagesize'] != virtual_specs['pagesize'] or
-                        physical_specs['eccsize'] != virtual_specs['eccsize'])):
-                        raise ValueError("Memory card sizes don't match! Cannot load file.")
-                    
-                    total_pages = virtual_specs['cardsize']
-
-                    print("Erasing physical card")
-                    self.current_reader.erase_all()
-
-                    sleep(5)
-
-                    print("Loading physical card")
-                    # Load all pages
-                    for page_num in range(total_pages):
-                        try:
-                            # Read page from virtual file
-                            cluster_data, ecc = virtual_reader.read_page(page_num)
-                            
-                            # Write page to physical card
-                            self.current_reader.write_page(page_num, cluster_data, ecc)
-                            
-                            # Update progress bar
-                            progress = ((page_num + 1) / total_pages) * 100
-                            self.root.after(0, lambda p=progress, c=page_num+1, t=total_pages: 
-                                          self.update_progress("Importing file to physical card", p, c, t))
-                                
-                        except Exception as e:
-                            print(f"Error processing page {page_num}: {e}")
-                            # Continue with next page
-                            continue
-                    
-                    # Close virtual reader
-                    virtual_reader.close()
-                    
-                    # Success message
-                    self.root.after(0, lambda: self.on_load_success(file_path))
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    self.root.after(0, lambda: self.on_load_error(error_msg))
-                    
-            threading.Thread(target=load_thread, daemon=True).start()
-            
+            # Run load on the shared worker pool
+            def load_task():
+                # Create virtual reader for source file
+                virtual_reader = VirtualPs2MemoryCardReader(file_path)
+                virtual_reader.open()
+
+                # Get card specifications from both readers
+                physical_specs = self.current_reader.get_card_specs()
+
+                virtual_specs = virtual_reader.get_card_specs()
+
+                # Check compatibility
+                if (self.current_reader.is_formatted() and (physical_specs['cardsize'] != virtual_specs['cardsize'] or
+                    physical_specs['blocksize'] != virtual_specs['blocksize'] or
+                    physical_specs['pagesize'] != virtual_specs['pagesize'] or
+                    physical_specs['eccsize'] != virtual_specs['eccsize'])):
+                    raise ValueError("Memory card sizes don't match! Cannot load file.")
+
+                total_pages = virtual_specs['cardsize']
+
+                log.debug("Erasing physical card")
+                self.current_reader.erase_all()
+
+                # Poll until the erase has settled instead of a blind wait
+                self.current_reader.wait_erase_complete(timeout=10)
+
+                log.debug("Loading physical card")
+
+                # Write pages in batches to amortize per-page call overhead
+                batch_pages = 64
+
+                # The card is freshly erased below, so batches that are
+                # entirely blank in the source image need no write at all
+                erased_byte = physical_specs['erased_byte']
+
+                # Pipeline file reads against USB writes through a bounded
+                # queue so neither side idles waiting on the other
+                page_queue = queue.Queue(maxsize=16)
+
+                def produce_pages():
+                    # Hoist loop invariants out of the per-batch path
+                    read_pages = virtual_reader.read_pages
+                    put = page_queue.put
+                    try:
+                        for start in range(0, total_pages, batch_pages):
+                            count = min(batch_pages, total_pages - start)
+                            try:
+                                put((start, read_pages(start, count)))
+                            except Exception as e:
+                                log.warning("pages %d-%d read error: %s", start, start + count - 1, e)
+                                # Continue with next batch
+                                continue
+                    finally:
+                        put(None)
+
+                # The producer gets its own thread: parking it on the shared
+                # pool could leave two consumers holding both workers with
+                # their producers stuck behind them in the pool queue
+                reader_thread = threading.Thread(target=produce_pages, daemon=True)
+                reader_thread.start()
+
+                # Drain batches until the producer posts its sentinel
+                while True:
+                    item = page_queue.get()
+                    if item is None:
+                        break
+                    start, chunk = item
+                    try:
+                        # Write batch to physical card, unless it is all blank
+                        if chunk.count(erased_byte) != len(chunk):
+                            self.current_reader.write_pages(start, chunk)
+
+                        # Publish progress; the Tk-side poller picks it up
+                        self._progress_shared = ("Importing file to physical card",
+                                                 min(start + batch_pages, total_pages), total_pages)
+
+                    except Exception as e:
+                        log.warning("pages from %d write error: %s", start, e)
+                        # Continue with next batch
+                        continue
+
+                reader_thread.join()
+
+                # Close virtual reader
+                virtual_reader.close()
+
+                # stat() the source here, not in the Tk-side handler
+                return file_path, os.path.getsize(file_path)
+
+            self._start_progress_poll()
+            future = self._executor.submit(load_task)
+            future.add_done_callback(lambda f: self.root.after(0, self._finalize_load, f))
+
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to start load: {str(e)}")
             self.status_var.set("Load failed")
 
+    def _finalize_load(self, future):
+        """Handle a finished load future on the Tk main thread"""
+        self._stop_progress_poll()
+        error = future.exception()
+        if error:
+            self.on_load_error(str(error))
+        else:
+            self.on_load_success(*future.result())
+
+    def _start_progress_poll(self):
+        """Start the periodic poller that drains worker progress to the UI"""
+        self._progress_shared = None
+        self._progress_applied = None
+        self._progress_job = self.root.after(50, self._poll_progress)
+
+    def _stop_progress_poll(self):
+        """Stop the progress poller and apply any final pending update"""
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            self._progress_job = None
+        self._apply_shared_progress()
+        self._progress_shared = None
+
+    def _poll_progress(self):
+        """Apply the latest worker progress and reschedule the poller"""
+        self._apply_shared_progress()
+        self._progress_job = self.root.after(50, self._poll_progress)
+
+    def _apply_shared_progress(self):
+        # Only format and touch the widgets when progress actually advanced
+        shared = self._progress_shared
+        if shared is not None and shared != self._progress_applied:
+            self._progress_applied = shared
+            text, current, total = shared
+            self.update_progress(text, (current / total) * 100, current, total)
+
     def update_progress(self, text, percentage, current, total):
         """Update the progress bar and label"""
         self.progress_bar['value'] = percentage
         self.progress_label.config(text=f"{text}... {current}/{total} pages ({percentage:.1f}%)")
         self.status_var.set(f"{text}... {percentage:.1f}%")
 
-    def on_dump_success(self, file_path):
+    def on_dump_success(self, file_path, size):
         """Handle successful dump completion"""
         self.status_var.set(f"✅ Dump completed: {os.path.basename(file_path)}")
-        
+
         # Hide progress bar
         self.progress_frame.pack_forget()
-        
+
         # Show success message
-        messagebox.showinfo("Dump Complete", 
+        messagebox.showinfo("Dump Complete",
                           f"Memory card successfully dumped to:\n{file_path}\n\n"
-                          f"File size: {os.path.getsize(file_path) / (1024*1024):.1f} MB")
+                          f"File size: {size / (1024*1024):.1f} MB")
 
     def on_dump_error(self, error_msg):
         """Handle dump error"""
@@ -928,17 +1062,20 @@ class Ps2MemoryCardGUI:
         
         messagebox.showerror("Dump Error", f"Failed to dump memory card:\n{error_msg}")
 
-    def on_load_success(self, file_path):
+    def on_load_success(self, file_path, size):
         """Handle successful load completion"""
+        # Card contents changed; cached directory listings are stale
+        self._dir_cache.clear()
+
         self.status_var.set(f"✅ Load completed: {os.path.basename(file_path)}")
         
         # Hide progress bar
         self.progress_frame.pack_forget()
         
         # Show success message
-        messagebox.showinfo("Load Complete", 
+        messagebox.showinfo("Load Complete",
                           f"Memory card successfully loaded from:\n{file_path}\n\n"
-                          f"File size: {os.path.getsize(file_path) / (1024*1024):.1f} MB")
+                          f"File size: {size / (1024*1024):.1f} MB")
 
     def on_load_error(self, error_msg):
         """Handle load error"""
@@ -970,38 +1107,54 @@ class Ps2MemoryCardGUI:
         self.progress_bar['value'] = 0
         self.progress_label.config(text="Erasing memory card... 0%")
         
-        def erase_thread():
-            try:
-                # Get card specs
-                specs = self.current_reader.get_card_specs()
-                total_pages = specs['cardsize']
-                
-                # Erase all pages
-                for page_num in range(total_pages):
-                    self.current_reader.erase_page(page_num)
-                    
-                    # Update progress
-                    progress = ((page_num + 1) / total_pages) * 100
-                    self.root.after(0, lambda p=progress, c=page_num+1, t=total_pages: 
-                    self.update_erase_progress(p, c, t))
-                
-                # Success
-                self.root.after(0, self.on_erase_success)
-                
-            except Exception as e:
-                error_msg = str(e)
-                self.root.after(0, lambda: self.on_erase_error(error_msg))
-                
-        threading.Thread(target=erase_thread, daemon=True).start()
-
-    def update_erase_progress(self, percentage, current, total):
-        """Update the erase progress bar and label"""
-        self.progress_bar['value'] = percentage
-        self.progress_label.config(text=f"Erasing memory card... {current}/{total} pages ({percentage:.1f}%)")
-        self.status_var.set(f"🧹 Erasing... {percentage:.1f}%")
+        # In fast mode, pages that already read back blank are not erased;
+        # the probe reads only pay off when a fair share of the card is blank
+        fast_mode = self.fast_erase_var.get()
+        if fast_mode:
+            # Probe reads don't need ECC verification
+            self.current_reader.verify_ecc = False
+
+        def erase_task():
+            # Get card specs
+            reader = self.current_reader
+            specs = reader.get_card_specs()
+            total_pages = specs['cardsize']
+            blank_page = bytes([specs['erased_byte']]) * specs['pagesize']
+
+            # Erase all pages; progress is picked up by the poller
+            erase_page = reader.erase_page
+            read_page = reader.read_page
+            for page_num in range(total_pages):
+                if not (fast_mode and read_page(page_num)[0] == blank_page):
+                    erase_page(page_num)
+                self._progress_shared = ("Erasing memory card", page_num + 1, total_pages)
+
+            # This loop bypasses erase_all, so drop the reader's caches the
+            # same way it would; everything cached describes erased data now
+            reader.superblock_cache = None
+            reader.fat_cluster_cache = None
+            reader.cluster_cache = None
+
+        self._start_progress_poll()
+        future = self._executor.submit(erase_task)
+        future.add_done_callback(lambda f: self.root.after(0, self._finalize_erase, f))
+
+    def _finalize_erase(self, future):
+        """Handle a finished erase future on the Tk main thread"""
+        self._stop_progress_poll()
+        if self.current_reader:
+            self.current_reader.verify_ecc = True
+        error = future.exception()
+        if error:
+            self.on_erase_error(str(error))
+        else:
+            self.on_erase_success()
 
     def on_erase_success(self):
         """Handle successful erase completion"""
+        # Card contents changed; cached directory listings are stale
+        self._dir_cache.clear()
+
         self.status_var.set("✅ Erase completed")
         
         # Hide progress bar
@@ -1024,6 +1177,7 @@ class Ps2MemoryCardGUI:
         messagebox.showerror("Erase Error", f"Failed to erase memory card:\n{error_msg}")
 
 def main():
+    logging.basicConfig(format='%(levelname)s %(name)s: %(message)s')
     root = tk.Tk()
     app = Ps2MemoryCardGUI(root)
     root.mainloop()
@@ -1,16 +1,15 @@
+import sys
+
+# ASCII column lookup: printable bytes map to themselves, the rest to '.'
+_PRINTABLE_TABLE = bytes(i if 32 <= i < 127 else 0x2E for i in range(256))
+
 def print_hex(data):
-    # Print data like in hex editors
+    # Print data like in hex editors, assembled into one buffered write
+    # instead of ~20 print calls per 16-byte line
+    data = bytes(data)
+    hex_str = data.hex(' ').upper()
+    ascii_str = data.translate(_PRINTABLE_TABLE).decode('ascii')
+    lines = []
     for i in range(0, len(data), 16):
-        print(f"{i:08X}  ", end="")
-        for j in range(i, i+16):
-            if j < len(data):
-                print(f"{data[j]:02X} ", end="")
-            else:
-                print("   ", end="")
-        print("  |", end="")
-        for j in range(i, i+16):
-            if j < len(data):
-                print(f"{chr(data[j])}", end="")
-            else:
-                print(" ", end="")
-        print()
\ No newline at end of file
+        lines.append(f"{i:08X}  {hex_str[i * 3:i * 3 + 47]:<47}   |{ascii_str[i:i + 16]:<16}\n")
+    sys.stdout.write(''.join(lines))